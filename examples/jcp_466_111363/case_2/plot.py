@@ -15,8 +15,8 @@ results_file = "mom.dat"
 ref_file = "mom_ref.dat"
 
 # load results and reference data
-t, mom = np.genfromtxt(results_file)[:,[0, order+1]].T
-tref, ref = np.genfromtxt(ref_file)[:,[0, order+1]].T
+t, mom = np.loadtxt(results_file, usecols=(0, order+1), unpack=True)
+tref, ref = np.loadtxt(ref_file, usecols=(0, order+1), unpack=True)
 assert np.allclose(t, tref)     # making sure the times are consistent
 
 # Setup plot and compare
@@ -14,7 +14,7 @@ results_file = "mom.dat"
 ref_file = "mom_ref.dat"
 
 # load results and reference data
-t, mom = np.genfromtxt(results_file)[:,[0, order+1]].T
+t, mom = np.loadtxt(results_file, usecols=(0, order+1), unpack=True)
 ref = np.genfromtxt(ref_file)[order]    # (assuming the reference solution is steady and thus 1D)
 
 # Setup plot and compare
@@ -18,8 +18,117 @@
 This module contains the product-difference inversion algorithm and derived algorithms.
 
 """
+import functools
+import os
 import numpy as np
 from quadmompy.core.inversion.basic import MomentInversion
+from quadmompy.core.utils import njit, NUMBA_AVAILABLE
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pd_kernel(size):
+    """
+    Create a product-difference kernel specialized for a fixed P-matrix size
+    `size = 2*n + 1 - iodd`.
+
+    The number of moments is usually constant over an entire simulation, so
+    the kernel is compiled once per size with `size`, and thus all loop trip
+    counts, as a compile-time constant, which allows the compiler to fully
+    unroll the short loops. Kernels are cached, i.e. repeated calls with the
+    same `size` return the same function object.
+
+    Parameters
+    ----------
+    size : int
+        Size of the (virtual) P-matrix, i.e. `2*n + 1 - iodd`.
+
+    Returns
+    -------
+    _pd_kernel : callable
+        Specialized product-difference kernel, see inline documentation.
+
+    """
+    def _pd_kernel(mom, n, iodd, alpha, beta, zeta, work):  # pylint:disable=too-many-arguments,too-many-locals
+        """
+        Compute the continued-fraction coefficients `zeta` as well as the
+        recurrence coefficients `alpha` and `beta` of orthogonal polynomials
+        from a given moment set using the product-difference algorithm
+        [:cite:label:`Gordon_1968`].
+
+        The P-matrix recurrence is written as explicit scalar loops, which
+        avoids the dispatch overhead of NumPy operations on short slices and
+        is compiled with Numba if available (plain Python otherwise). Since
+        each column of the P-matrix only depends on the two preceding ones,
+        the full matrix is never stored; three rotating column buffers keep
+        the working set small and avoid the quadratic memory footprint.
+
+        Parameters
+        ----------
+        mom : array
+            Set of realizable moments with `len(mom) == 2*n - iodd`.
+        n : int
+            Number of recurrence coefficients to be computed.
+        iodd : int
+            Integer that takes the value 0 if the number of moments is even
+            and 1 if it is odd.
+        alpha : array
+            Array to store the first set of recurrence coefficients.
+        beta : array
+            Array to store the second set of recurrence coefficients.
+        zeta : array
+            Array of length `2*n - iodd` to store the continued-fraction
+            coefficients.
+        work : array
+            Work buffer of shape `(4, size)` whose rows serve as the column
+            and head buffers described below, reusable across calls.
+
+        """
+        # Initialize the first two columns of the P-matrix with the
+        # alternating signs applied directly instead of negating all even
+        # rows afterwards. `head` stores the first matrix row, which is all
+        # that is needed for the continued-fraction coefficients.
+        prev2 = work[0]
+        prev1 = work[1]
+        cur = work[2]
+        head = work[3]
+        for i in range(size):
+            prev2[i] = 0.
+        prev2[0] = -1.
+        sign = -1.
+        for i in range(size - 1):
+            prev1[i] = sign*mom[i]
+            sign = -sign
+        prev1[size-1] = 0.
+        head[0] = prev2[0]
+        head[1] = prev1[0]
+
+        for j in range(2, size):
+            c1 = head[j-1]
+            c2 = head[j-2]
+            for i in range(size + 1 - j):
+                cur[i] = c1*prev2[i+1] - c2*prev1[i+1]
+            head[j] = cur[0]
+            # Rotate buffers instead of copying; the former `prev2` is
+            # overwritten in the next iteration
+            prev2, prev1, cur = prev1, cur, prev2
+
+        # Continued-fraction coefficients from the first matrix row
+        for i in range(1, size - 1):
+            zeta[i] = head[i+1]/head[i]/head[i-1]
+
+        # Recurrence coefficients from continued-fraction coefficients
+        for i in range(n - iodd):
+            alpha[i] = zeta[2*i+1] + zeta[2*i]
+        for i in range(n - 1):
+            beta[i+1] = zeta[2*i+2]*zeta[2*i+1]
+
+    # Closure variables prevent ahead-of-time caching, so `cache=True` is not
+    # passed here. The NumPy error model keeps the nan/inf propagation of the
+    # plain-Python version on degenerate moment sets instead of raising
+    # `ZeroDivisionError`; for the same reason `fastmath` must not be used,
+    # as it would make nan/inf propagation unreliable.
+    return njit(boundscheck=False, error_model='numpy')(_pd_kernel)
+
 
 class ProductDifference(MomentInversion):
     """
@@ -37,12 +146,22 @@ class ProductDifference(MomentInversion):
     ----------
     zeta : array
         Stored continued-fraction coefficients computed during calculation of
-        recursion coefficients.
+        recursion coefficients. The array is overwritten in place by
+        subsequent calls with the same problem size.
+    _kernel : callable
+        Product-difference kernel specialized for the current problem size,
+        see `_get_pd_kernel`.
+    _kernel_size : int
+        P-matrix size for which `_kernel` was created.
+    _work : array
+        Persistent work buffer passed to the kernel, reused across calls.
 
     Notes
     -----
     Several implementations were tested including NumPy routines. Given only a
-    few moments (< 20), this implementation proved to be the most efficient.
+    few moments (< 20), an implementation with explicit scalar loops proved to
+    be the most efficient, see `_get_pd_kernel`. It is compiled just-in-time
+    with Numba if available and runs as plain Python otherwise.
 
     References
     ----------
@@ -54,23 +173,26 @@ class ProductDifference(MomentInversion):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.zeta = np.array([])
+        self._kernel = None
+        self._kernel_size = 0
+        self._work = None
 
     def _compute_rc(self, mom, n, iodd, alpha, beta):   # pylint:disable=too-many-arguments
         size = 2*n + 1 - iodd
-        p_mat = np.zeros((size, size))
-        p_mat[0,0] = 1.
-        p_mat[:-1,1] = mom
-        p_mat[::2] *= -1
-
-        for j in range(2, size):
-            k = size + 2 - j
-            p_mat[:(k-1),j] = p_mat[0,j-1]*p_mat[1:k,j-2] - p_mat[0,j-2]*p_mat[1:k,j-1]
-
-        self.zeta = np.zeros(size - 1)
-        self.zeta[1:] = p_mat[0,2:]/p_mat[0,1:-1]/p_mat[0,:-2]
-
-        alpha[:n-iodd] = self.zeta[1::2] + self.zeta[:-1:2]
-        beta[1:] = self.zeta[2::2]*self.zeta[1:-1:2]
+        # The kernel runs without bounds checks, so the moment count must be
+        # validated here
+        if len(mom) != size - 1:
+            msg = f"Invalid number of moments: expected {size - 1}, got {len(mom)}."
+            raise ValueError(msg)
+        # (Re)create kernel and buffers only when the problem size changes,
+        # e.g. in adaptive algorithms; steady-state calls are allocation-free
+        if size != self._kernel_size:
+            self._kernel = _get_pd_kernel(size)
+            self._kernel_size = size
+            self._work = np.empty((4, size))
+            self.zeta = np.zeros(size - 1)
+        self._kernel(np.ascontiguousarray(mom, dtype=np.float64), n, iodd, alpha, beta,
+                     self.zeta, self._work)
 
 
 class ProductDifferenceAdaptive(ProductDifference):
@@ -114,3 +236,21 @@ class ProductDifferenceAdaptive(ProductDifference):
 
     def moment_inversion(self, mom):
         return self._moment_inversion_ad(mom)
+
+
+def _warmup():
+    """
+    Trigger compilation of a small product-difference kernel so that scripts
+    pay the one-time JIT cost at import rather than at the first inversion.
+
+    """
+    # Moments of a non-degenerate two-node quadrature
+    mom = np.array([1., 0.4, 0.7, 0.55])
+    _get_pd_kernel(5)(mom, 2, 0, np.zeros(2), np.zeros(2), np.zeros(4), np.empty((4, 5)))
+
+
+# Compile a kernel at import time if explicitly requested, e.g. by short
+# command-line scripts that would otherwise pay the JIT delay at the first
+# QBMM call
+if NUMBA_AVAILABLE and os.environ.get("QUADMOMPY_WARMUP") == "1":
+    _warmup()
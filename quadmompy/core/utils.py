@@ -18,10 +18,44 @@
 Module for some helpful utilities used by other parts of the package.
 
 """
+from collections import deque
+
+try:
+    # Imported for re-export by the modules with optionally compiled kernels
+    from numba import njit, prange  # pylint:disable=unused-import
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):  # pylint:disable=unused-argument
+        """
+        No-op replacement for the `numba.njit` decorator used when Numba is
+        not installed, leaving the decorated function as plain Python.
+
+        """
+        if args and callable(args[0]):
+            return args[0]
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Cache of flattened subclass lists keyed by base class, storing the number of
+# direct subclasses at the time of caching for invalidation
+_subclass_cache = {}
+
+
 def get_all_subclasses(cls):
     """
     Get all subclasses of a given base class all the way down to the bottom of the class hierarchy.
 
+    The result is cached per base class since the recursive walk is repeated
+    on every dynamic type lookup, e.g. in `Qbmm.new`. A cached entry is
+    invalidated when the number of direct subclasses of the base class
+    changes, e.g. after the import of a module defining additional
+    subclasses.
+
     Parameters
     ----------
     cls : type
@@ -33,8 +67,16 @@ def get_all_subclasses(cls):
         A flat list of all subclasses with no hierarchy, regardless of the actual class hierarchy.
 
     """
+    cached = _subclass_cache.get(cls)
+    if cached is not None and len(cls.__subclasses__()) == cached[1]:
+        return cached[0]
+    # Iterative breadth-first traversal avoids the per-class Python call
+    # overhead of a recursive walk
     all_subclasses = []
-    for subclass in cls.__subclasses__():
+    queue = deque(cls.__subclasses__())
+    while queue:
+        subclass = queue.popleft()
         all_subclasses.append(subclass)
-        all_subclasses.extend(get_all_subclasses(subclass))
+        queue.extend(subclass.__subclasses__())
+    _subclass_cache[cls] = (all_subclasses, len(cls.__subclasses__()))
     return all_subclasses
@@ -19,8 +19,83 @@ Module for the generation of random moment sequences.
 """
 import abc
 import numpy as np
-from scipy import stats
-from quadmompy.moments.transform import rc2mom
+from scipy.special import gammaln
+from quadmompy.core.utils import njit, prange
+
+
+@njit(cache=True, fastmath=True)
+def _rc2mom_kernel(alpha, beta, mom):
+    """
+    Compute the moments corresponding to given recurrence coefficients of
+    orthogonal polynomials, equivalent to
+    :meth:`~quadmompy.moments.transform.rc2mom`.
+
+    Instead of forming dense powers of the Jacobi matrix, only the vector
+    `J^k e_0` is tracked, which reduces each step to a tridiagonal
+    matrix-vector product written as explicit scalar loops without
+    temporaries. The kernel is compiled with Numba if available.
+
+    Parameters
+    ----------
+    alpha : array
+        First set of recurrence coefficients.
+    beta : array
+        Second set of recurrence coefficients.
+    mom : array
+        Output array of length `len(alpha) + len(beta)` to store the moments.
+
+    """
+    n = beta.shape[0]
+    nmom = mom.shape[0]
+
+    # Diagonal and (symmetric) off-diagonal of the Jacobi matrix; if `alpha`
+    # is one element short, the last diagonal element does not affect the
+    # computed moments and is arbitrary (here 1, as in `transform.rc2mom`)
+    diag = np.empty(n)
+    for i in range(alpha.shape[0]):
+        diag[i] = alpha[i]
+    if alpha.shape[0] < n:
+        diag[n-1] = 1.
+    offdiag = np.empty(n - 1)
+    for i in range(n - 1):
+        offdiag[i] = np.sqrt(beta[i+1])
+
+    # The kth moment is the top-left element of the kth power of the Jacobi
+    # matrix (see `transform.rc2mom`), i.e. the first element of v = J^k e_0
+    v = np.zeros(n)
+    v[0] = 1.
+    w = np.empty(n)
+    mom[0] = beta[0]
+    for k in range(1, nmom):
+        for i in range(n):
+            s = diag[i]*v[i]
+            if i > 0:
+                s += offdiag[i-1]*v[i-1]
+            if i < n - 1:
+                s += offdiag[i]*v[i+1]
+            w[i] = s
+        v, w = w, v
+        mom[k] = v[0]
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _rc2mom_batch(alpha, beta, mom):
+    """
+    Batched version of `_rc2mom_kernel` processing one sample per row,
+    parallelized over samples with Numba's `prange` if available.
+
+    Parameters
+    ----------
+    alpha : array
+        First sets of recurrence coefficients, one sample per row.
+    beta : array
+        Second sets of recurrence coefficients, one sample per row.
+    mom : array
+        Output array of shape `(n_samples, nmom)` to store the moments.
+
+    """
+    for k in prange(alpha.shape[0]):    # pylint:disable=not-an-iterable
+        _rc2mom_kernel(alpha[k], beta[k], mom[k])
 
 
 class RandomMoments:
@@ -38,9 +113,7 @@ class RandomMoments:
         Must be provided if `rng` is `None` and is only used in that case to
         create a new random number generator.
     dtype : type
-        Floating point type. The choice of this variable does not affect the
-        sampling procedure of random quantities but only the computation of
-        moments and return values.
+        Floating point type used for sampling and all computed quantities.
 
     Attributes
     ----------
@@ -54,9 +127,7 @@ class RandomMoments:
     _rng : numpy.random.Generator
         Random number generator.
     dtype : type
-        Floating point type. The choice of this variable does not affect the
-        sampling procedure of random quantities but only the computation of
-        moments and return values.
+        Floating point type used for sampling and all computed quantities.
 
     """
     def __init__(self, nmom, rng, random_seed, dtype):
@@ -129,9 +200,9 @@ class RandomHamburgerMoments(RandomMoments):
         Must be provided if `rng` is `None` and is only used in that case to
         create a new random number generator.
     dtype : type, optional
-        Floating point type. The choice of this variable does not affect the
-        sampling procedure of random quantities but only the computation of
-        moments and return values. Default value is `numpy.float64`.
+        Floating point type used for sampling and all computed quantities.
+        Supported types are `numpy.float32` and `numpy.float64`. Default
+        value is `numpy.float64`.
 
     Attributes
     ----------
@@ -145,21 +216,33 @@ class RandomHamburgerMoments(RandomMoments):
     _rng : numpy.random.Generator
         Random number generator.
     dtype : type
-        Floating point type. The choice of this variable does not affect the
-        sampling procedure of random quantities but only the computation of
-        moments and return values.
+        Floating point type used for sampling and all computed quantities.
+        Supported types are `numpy.float32` and `numpy.float64`.
     gamma : array
         An array containing the `gamma`-parameters. The length depends on
         `nmom`.
     delta : array
         An array containing the `delta`-parameters. The length depends on
         `nmom`.
-    _alpha_rv : list
-        List containing a `scipy.stats.norm` distribution with the given
-        parameters for each recurrence coefficient `alpha`.
-    _beta_rv : list
-        List containing a `scipy.stats.gamma` distribution with the given
-        parameters for each recurrence coefficient `beta`.
+    _alpha_scales : array
+        Standard deviations of the normal distributions of the recurrence
+        coefficients `alpha`.
+    _beta_shapes : array
+        Shape parameters of the Gamma-distributions of the recurrence
+        coefficients `beta`.
+    _beta_scales : array
+        Scale parameters of the Gamma-distributions of the recurrence
+        coefficients `beta`.
+    _log_beta_norm : array
+        Logarithm of the normalization constants of the Gamma-distributions
+        of the recurrence coefficients `beta` (only used for PDF evaluation).
+    _jac_exp : array
+        Run-constant exponents of the Jacobian determinant (only used for PDF
+        evaluation).
+    _alpha_buf : array
+        Persistent buffer for the sampled recurrence coefficients `alpha`.
+    _beta_buf : array
+        Persistent buffer for the sampled recurrence coefficients `beta`.
     alpha : array
         An array to store first set of recurrence coefficients.
     beta : array
@@ -178,6 +261,13 @@ class RandomHamburgerMoments(RandomMoments):
                     random_seed=None, dtype=np.float64):
         super().__init__(nmom, rng=rng, random_seed=random_seed, dtype=dtype)
 
+        # Samples are drawn directly in the target floating point type, which
+        # the generator only supports for single and double precision
+        if np.dtype(self.dtype) not in (np.dtype(np.float32), np.dtype(np.float64)):
+            msg = "Invalid parameter: `dtype` must be `numpy.float32` or `numpy.float64`."
+            raise ValueError(msg)
+        self.dtype = np.dtype(self.dtype).type
+
         # First check validity of given parameters based on the conditions in Ref. [Dette2012]
         if (len(gamma) != self.n - 1) or np.any(gamma <= -2*(self.n - np.arange(1, self.n))):
             msg = "Invalid parameter: `gamma` must satisfy `len(gamma) == n - 1` \
@@ -191,23 +281,32 @@ class RandomHamburgerMoments(RandomMoments):
             raise ValueError(msg)
         self.delta = delta
 
-        # Initialize normal distributions for generation of alphas. SciPy uses common
-        # parameter `sigma`, i.e. the standard deviation whereas the variance `sigma**2`
-        # is used in Ref. [Dette2012]
-        self._alpha_rv = [stats.norm(scale=(0.5/d)**0.5)
-                          for d in self.delta[:2*self.n-self.iodd-1:2]]
-        #self._alpha_rv = self._alpha_rv[:len(self._alpha_rv)-self.iodd]
+        # Parameters of the normal distributions for generation of alphas. SciPy/NumPy
+        # use the common parameter `sigma`, i.e. the standard deviation whereas the
+        # variance `sigma**2` is used in Ref. [Dette2012]
+        self._alpha_scales = (0.5/self.delta[:2*self.n-self.iodd-1:2])**0.5
 
-        # Initialize Gamma-distributions for generation of betas. SciPy uses the k-theta
-        # parametrization of the Gamma-distribution -> theta[j] = 1/delta[2*j+1]
-        shape = self.gamma + 2*self.n - 2*np.arange(1, self.n)
-        scale = 1./self.delta[1::2]
-        self._beta_rv = [stats.gamma(a=shape[i], scale=scale[i]) for i in range(len(shape))]
+        # Parameters of the Gamma-distributions for generation of betas in the k-theta
+        # parametrization used by SciPy/NumPy -> theta[j] = 1/delta[2*j+1]
+        self._beta_shapes = self.gamma + 2*self.n - 2*np.arange(1, self.n)
+        self._beta_scales = 1./self.delta[1::2]
+
+        # Logarithm of the Gamma-distribution normalization constants and
+        # run-constant Jacobian exponents used in `pdf`
+        self._log_beta_norm = -gammaln(self._beta_shapes) \
+                                - self._beta_shapes*np.log(self._beta_scales)
+        self._jac_exp = (2*self.n - 2*np.arange(self.n) - 1 - self.iodd).astype(self.dtype)
 
         # initialize recurrence coefficients with extreme or invalid values
         self.alpha = -1e300*np.ones(self.n - self.iodd, dtype=self.dtype)
         self.beta = -1e300*np.ones(self.n, dtype=self.dtype)
 
+        # Persistent sample buffers reused by `_gen_recurrence_coeffs` to
+        # avoid per-call allocations; the leading beta is always one
+        self._alpha_buf = np.empty(self.n - self.iodd, dtype=self.dtype)
+        self._beta_buf = np.empty(self.n, dtype=self.dtype)
+        self._beta_buf[0] = 1.
+
     def pdf(self, mom, inv):
         """
         Value of the probability density function at given point `mom` in
@@ -245,14 +344,19 @@ class RandomHamburgerMoments(RandomMoments):
 
         alpha, beta = inv.recurrence_coeffs(mom)
 
-        # Factor corresponging to alpha coefficients
-        f_alpha = np.prod([self._alpha_rv[i].pdf(alpha[i]) for i in range(self.n - self.iodd)])
-        # Factor corresponging to beta coefficients
-        f_beta = np.prod([self._beta_rv[i-1].pdf(beta[i]) for i in range(1, self.n)])
+        # The closed-form normal and Gamma log-densities are evaluated as
+        # vector expressions; accumulating in log-space also avoids underflow
+        # for long moment sequences.
+        # Factor corresponding to alpha coefficients
+        log_f_alpha = np.sum(-0.5*(alpha/self._alpha_scales)**2
+                             - 0.5*np.log(2*np.pi) - np.log(self._alpha_scales))
+        # Factor corresponding to beta coefficients
+        log_f_beta = np.sum((self._beta_shapes - 1)*np.log(beta[1:])
+                            - beta[1:]/self._beta_scales + self._log_beta_norm)
         # Jacobian determinant, follows from Eqs. (2.10) and (2.11) in Ref. [Dette_2012]
-        jac_det = np.prod(beta**(2*self.n - 2*np.arange(self.n) - 1 - self.iodd))
+        log_jac_det = np.sum(self._jac_exp*np.log(beta))
 
-        return f_alpha * f_beta / jac_det
+        return np.exp(log_f_alpha + log_f_beta - log_jac_det)
 
     def _gen_recurrence_coeffs(self):
         """
@@ -272,14 +376,23 @@ class RandomHamburgerMoments(RandomMoments):
             Second set of random recurrence coefficients of orthogonal
             polynomials.
 
+        Notes
+        -----
+        The returned arrays are persistent buffers overwritten by subsequent
+        calls; callers that keep results across calls must copy explicitly.
+
         """
-        alpha = np.array([rv.rvs(random_state=self._rng)
-                            for rv in self._alpha_rv], dtype=self.dtype
-                         )
-        beta = np.array([rv.rvs(random_state=self._rng)
-                            for rv in self._beta_rv], dtype=self.dtype
-                        )
-        return alpha, np.append(1., beta)
+        # Draw all samples with single generator calls instead of per-element
+        # SciPy `rvs`-calls, which are dominated by Python dispatch overhead.
+        # The draws go directly into the preallocated buffers, which are
+        # subsequently scaled in place.
+        alpha = self._alpha_buf
+        beta = self._beta_buf
+        self._rng.standard_normal(out=alpha, dtype=self.dtype)
+        alpha *= self._alpha_scales
+        self._rng.standard_gamma(self._beta_shapes, out=beta[1:], dtype=self.dtype)
+        beta[1:] *= self._beta_scales
+        return alpha, beta
 
     def generate(self):
         """
@@ -302,5 +415,44 @@ class RandomHamburgerMoments(RandomMoments):
         alpha, beta = self._gen_recurrence_coeffs()
         self.alpha[:] = alpha
         self.beta[:] = beta
-        mom = rc2mom(alpha, beta)
+        mom = np.empty(self.nmom, dtype=self.dtype)
+        _rc2mom_kernel(alpha, beta, mom)
         return mom
+
+    def generate_many(self, n_samples):
+        """
+        Generate a batch of random Hamburger moment sequences.
+
+        All recurrence coefficients are sampled with single generator calls
+        and the moments are computed in one batched kernel call, which
+        amortizes the per-sample Python overhead of repeated
+        :meth:`generate`-calls across the batch and, if Numba is available,
+        parallelizes the moment computation over samples.
+
+        Parameters
+        ----------
+        n_samples : int
+            Number of moment sequences to generate.
+
+        Returns
+        -------
+        mom : array
+            Array of shape `(n_samples, nmom)` containing one random
+            Hamburger moment sequence per row.
+
+        References
+        ----------
+        +--------------+--------------------+
+        | [Dette_2016] | :cite:`Dette_2016` |
+        +--------------+--------------------+
+
+        """
+        alpha = self._rng.normal(scale=self._alpha_scales,
+                                 size=(n_samples, self.n - self.iodd))
+        beta = np.empty((n_samples, self.n))
+        beta[:,0] = 1.
+        beta[:,1:] = self._rng.gamma(self._beta_shapes, self._beta_scales,
+                                     size=(n_samples, self.n - 1))
+        mom = np.empty((n_samples, self.nmom))
+        _rc2mom_batch(alpha, beta, mom)
+        return mom.astype(self.dtype, copy=False)
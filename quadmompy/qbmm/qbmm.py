@@ -29,6 +29,10 @@ class Qbmm(metaclass=abc.ABCMeta):
     Base class for quadrature-based moment methods (QBMMs).
 
     """
+    # Cached name -> type lookup tables keyed by base class, along with the
+    # number of subclasses at the time of caching for invalidation
+    _type_registries = {}
+
     @abc.abstractmethod
     def moment_inversion(self, mom):
         """
@@ -77,28 +81,47 @@ class Qbmm(metaclass=abc.ABCMeta):
         """
         if n_dims is not None:
             qbmm_setup["n_dims"] = n_dims   # n_dims is needed in qbmm_setup by multivariate classes
-        try:
+        if isinstance(qbmm_type, type):
             if issubclass(qbmm_type, cls):
                 return qbmm_type.new(qbmm_setup, **kwargs)
-        except TypeError:
-            subclasses = utils.get_all_subclasses(cls)
-            qbmm_types = {}
-            for scls in subclasses:
-                try:
-                    qbmm_types[scls.name] = scls
-                except AttributeError:          # not all subclasses have the attribute `name`
-                    pass
+        else:
+            try:
+                return cls._get_type_registry()[qbmm_type].new(qbmm_setup, **kwargs)
+            except KeyError as err:
+                valid_types = list(cls._get_type_registry().keys())
+                msg = f"Unknown {cls.__name__}-type `{qbmm_type}`. " \
+                    f"Available types are: {valid_types}."
+                raise ValueError(msg) from err
+
+    @classmethod
+    def _get_type_registry(cls):
+        """
+        Get the lookup table mapping both the `name` attribute (where present)
+        and the class name of all `cls`-subclasses to the respective type,
+        with `name` taking precedence in case of a clash.
+
+        The table is cached per base class and only rebuilt when the number
+        of subclasses changes, so the common string lookup in :meth:`new`
+        reduces to a single dictionary access.
+
+        Returns
+        -------
+        registry : dict
+            Dictionary mapping names to `cls`-subclasses.
+
+        """
+        subclasses = utils.get_all_subclasses(cls)
+        cached = cls._type_registries.get(cls)
+        if cached is not None and cached[1] == len(subclasses):
+            return cached[0]
+        registry = {scls.__name__: scls for scls in subclasses}
+        for scls in subclasses:
             try:
-                return qbmm_types[qbmm_type].new(qbmm_setup, **kwargs)
-            except KeyError:
-                try:
-                    qbmm_types = {scls.__name__: scls for scls in subclasses}
-                    return qbmm_types[qbmm_type].new(qbmm_setup, **kwargs)
-                except KeyError as err:
-                    valid_types = list(qbmm_types.keys())
-                    msg = f"Unknown {cls.__name__}-type `{qbmm_type}`. " \
-                        f"Available types are: {valid_types}."
-                    raise ValueError(msg) from err
+                registry[scls.name] = scls
+            except AttributeError:          # not all subclasses have the attribute `name`
+                pass
+        cls._type_registries[cls] = (registry, len(subclasses))
+        return registry
 
     @classmethod
     def from_dict(cls, setup_dict):
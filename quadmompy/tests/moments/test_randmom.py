@@ -0,0 +1,142 @@
+# pylint: disable=import-outside-toplevel
+"""
+Test of `moments.randmom` module.
+
+"""
+import pytest
+
+
+def _make_randmom(nmom, dtype, seed):
+    """
+    Create a `RandomHamburgerMoments` object with valid parameters for the
+    given number of moments.
+
+    Parameters
+    ----------
+    nmom : int
+        Number of moments.
+    dtype : type
+        Floating point type.
+    seed : int
+        Random seed.
+
+    Returns
+    -------
+    randmom : RandomHamburgerMoments
+        Random moment generator.
+
+    """
+    import numpy as np
+    from quadmompy.moments.randmom import RandomHamburgerMoments
+
+    n = (nmom + 1)//2
+    gamma = np.arange(1., n)
+    delta = np.linspace(0.5, 2., 2*n - 1)
+    return RandomHamburgerMoments(nmom, gamma, delta, random_seed=seed, dtype=dtype)
+
+
+@pytest.mark.parametrize("nmom", [6, 7, 8])
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_generate(nmom, dtype):
+    """
+    Test that the moment sequences returned by
+    `RandomHamburgerMoments.generate` match the moments computed with
+    `transform.rc2mom` from the stored recurrence coefficients.
+
+    Parameters
+    ----------
+    nmom : int
+        Number of moments.
+    dtype : str
+        Name of the floating point type.
+
+    """
+    import numpy as np
+    from quadmompy.moments.transform import rc2mom
+
+    dtype = np.dtype(dtype).type
+    randmom = _make_randmom(nmom, dtype, pytest.random_seed)    # pylint:disable=no-member
+    rtol = 1e-4 if dtype is np.float32 else 1e-12
+    for _ in range(10):
+        mom = randmom.generate()
+        assert mom.dtype == dtype and len(mom) == nmom
+        mom_ref = rc2mom(randmom.alpha.astype(np.float64), randmom.beta.astype(np.float64))
+        assert np.allclose(mom, mom_ref, rtol=rtol)
+
+
+@pytest.mark.parametrize("nmom", [6, 7, 8])
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_generate_many(nmom, dtype):
+    """
+    Test that each moment sequence in a batch returned by
+    `RandomHamburgerMoments.generate_many` is realizable and consistent with
+    `transform.rc2mom` applied to the recurrence coefficients recovered by
+    moment inversion.
+
+    Parameters
+    ----------
+    nmom : int
+        Number of moments.
+    dtype : str
+        Name of the floating point type.
+
+    """
+    import numpy as np
+    from quadmompy.core.inversion.wheeler import Wheeler
+    from quadmompy.moments.transform import rc2mom
+
+    dtype = np.dtype(dtype).type
+    randmom = _make_randmom(nmom, dtype, pytest.random_seed)    # pylint:disable=no-member
+    n_samples = 20
+    mom = randmom.generate_many(n_samples)
+    assert mom.shape == (n_samples, nmom)
+    assert mom.dtype == dtype
+
+    inv = Wheeler()
+    rtol = 1e-3 if dtype is np.float32 else 1e-8
+    for mom_k in mom.astype(np.float64):
+        alpha, beta = inv.recurrence_coeffs(mom_k)
+        assert np.all(beta > 0.)
+        assert np.allclose(rc2mom(alpha, beta), mom_k, rtol=rtol)
+
+
+@pytest.mark.parametrize("nmom", [6, 7, 8])
+def test_pdf(nmom):
+    """
+    Test the PDF of `RandomHamburgerMoments` against the explicit
+    formulation with SciPy distributions, i.e. the product of the
+    normal/Gamma-densities of the recurrence coefficients divided by the
+    Jacobian determinant, Eq. (2.19) in Ref. [:cite:label:`Dette_2012`].
+
+    Parameters
+    ----------
+    nmom : int
+        Number of moments.
+
+    References
+    ----------
+        +--------------+--------------------+
+        | [Dette_2012] | :cite:`Dette_2012` |
+        +--------------+--------------------+
+
+    """
+    import numpy as np
+    from scipy import stats
+    from quadmompy.core.inversion.wheeler import Wheeler
+
+    randmom = _make_randmom(nmom, np.float64, pytest.random_seed)   # pylint:disable=no-member
+    n = randmom.n
+    iodd = randmom.iodd
+    delta = randmom.delta
+    alpha_scales = (0.5/delta[:2*n-iodd-1:2])**0.5
+    beta_shapes = randmom.gamma + 2*n - 2*np.arange(1, n)
+    beta_scales = 1./delta[1::2]
+
+    inv = Wheeler()
+    for _ in range(10):
+        mom = randmom.generate()
+        alpha, beta = inv.recurrence_coeffs(mom)
+        f_alpha = np.prod(stats.norm.pdf(alpha, scale=alpha_scales))
+        f_beta = np.prod(stats.gamma.pdf(beta[1:], beta_shapes, scale=beta_scales))
+        jac_det = np.prod(beta**(2*n - 2*np.arange(n) - 1 - iodd))
+        assert np.isclose(randmom.pdf(mom, inv), f_alpha*f_beta/jac_det)